@@ -1,7 +1,7 @@
 from pathlib import Path
 from dotenv import load_dotenv
 import os
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 
 dotenv_path = Path(__file__).resolve().parent / ".env"
 load_dotenv(dotenv_path)
@@ -9,14 +9,17 @@ load_dotenv(dotenv_path)
 MONGO_URI = os.getenv("MONGO_URI") or os.getenv("MONGO_URL") or os.getenv("DATABASE_URL")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "academic_resources_db")
 
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+
+# The client connects lazily; connectivity is checked by the startup ping in database.py.
+# A client that cannot even be configured (e.g. a malformed URI) is fatal at import,
+# so route handlers never need to guard against a missing db.
 try:
-    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
-    client.admin.command('ping')  # Test connection
+    client = AsyncIOMotorClient(MONGO_URI, maxPoolSize=MONGO_MAX_POOL_SIZE, serverSelectionTimeoutMS=5000)
     db = client[DATABASE_NAME]
-    print(f"MongoDB connected successfully to database: {DATABASE_NAME}")
+    print(f"MongoDB client configured for database: {DATABASE_NAME}")
 except Exception as e:
-    print(f"MongoDB connection failed: {e}")
-    db = None
+    raise RuntimeError(f"MongoDB client configuration failed: {e}") from e
 
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY") or os.getenv("SECRET_KEY") or "change_this_secret"
 SECRET_KEY = JWT_SECRET_KEY
@@ -26,6 +29,10 @@ ALGORITHM = JWT_ALGORITHM
 
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440"))
 
+# Verified JWT payloads are cached briefly so repeat requests skip signature checks
+JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "10000"))
+JWT_CACHE_TTL = float(os.getenv("JWT_CACHE_TTL", "5"))
+
 ALLOWED_ORIGINS_STR = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000")
 ALLOWED_ORIGINS = [origin.strip() for origin in ALLOWED_ORIGINS_STR.split(",")]
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
@@ -43,6 +50,11 @@ MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", "10485760"))  # 10MB default
 
 DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "20"))
 MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "100"))
+MAX_BULK_SIZE = int(os.getenv("MAX_BULK_SIZE", "1000"))
+
+# Per-process cache for GET /{id} responses; invalidated on update/delete in this process
+ITEM_CACHE_SIZE = int(os.getenv("ITEM_CACHE_SIZE", "1024"))
+ITEM_CACHE_TTL = float(os.getenv("ITEM_CACHE_TTL", "30"))
 
 print(f"Configuration loaded:")
 print(f"  - Database: {DATABASE_NAME}")
@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 # create_admin.py
 from dotenv import load_dotenv
-from database import db
+from pymongo import MongoClient
+from config import MONGO_URI, DATABASE_NAME
 import os, sys, uuid
 from passlib.context import CryptContext
 from datetime import datetime
 
 load_dotenv()
 
+# Standalone script: use a blocking client rather than the app's async config.db
+db = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)[DATABASE_NAME]
+
 pwd = CryptContext(schemes=["bcrypt"], deprecated="auto")
 ADMIN_EMAIL = os.getenv("ADMIN_EMAIL")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD")
@@ -1,10 +1,96 @@
 # database.py
 
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure, PyMongoError
 from config import db
 
-# Optional ping to validate connection via the config.db client
-try:
-    db.client.admin.command("ping")
-    print("✅ MongoDB connected successfully via config.db")
-except Exception as e:
-    print(f"❌ MongoDB ping failed (database.py): {e}")
+# Fields covered by each collection's text index; also the regex fallback targets
+SEARCH_FIELDS = {
+    "notes": ("title", "description", "tags"),
+    "papers": ("title", "abstract", "authors", "tags"),
+    "syllabus": ("title", "course_code", "branch", "description", "tags"),
+}
+
+# Indexes backing each collection's list query path. The (created_at, _id)
+# compound also serves plain created_at sorts, so no single-field index is needed.
+# Text indexes are derived from SEARCH_FIELDS in ensure_indexes().
+COLLECTION_INDEXES = {
+    "notes": [
+        [("created_at", -1), ("_id", -1)],
+    ],
+    "papers": [
+        [("created_at", -1), ("_id", -1)],
+    ],
+    "syllabus": [
+        [("created_at", -1), ("_id", -1)],
+    ],
+}
+
+# Indexes earlier versions created that no query reads any more; dropped so
+# writes stop maintaining them
+RETIRED_INDEXES = {
+    "notes": ["tags_1"],
+    "papers": ["tags_1", "authors_1"],
+    "syllabus": ["tags_1"],
+}
+
+
+async def get_db() -> AsyncIOMotorDatabase:
+    """FastAPI dependency returning the shared database handle."""
+    return db
+
+
+async def ping_database():
+    """Validate the connection via the config.db client (run from a startup hook)."""
+    try:
+        await db.client.admin.command("ping")
+        print("✅ MongoDB connected successfully via config.db")
+        return True
+    except Exception as e:
+        print(f"❌ MongoDB ping failed (database.py): {e}")
+        return False
+
+
+_indexes_ready = False
+_indexes_lock = asyncio.Lock()
+
+
+async def ensure_indexes():
+    """Create the indexes the list/search query paths rely on (idempotent).
+
+    Connection errors propagate so callers can retry; once every index has been
+    created, later calls return immediately.
+    """
+    global _indexes_ready
+    async with _indexes_lock:
+        if _indexes_ready:
+            return
+        for name, indexes in COLLECTION_INDEXES.items():
+            text_index = [(field, "text") for field in SEARCH_FIELDS[name]]
+            for keys in indexes + [text_index]:
+                try:
+                    await db[name].create_index(keys)
+                except OperationFailure as e:
+                    # e.g. an existing index with the same keys but different options
+                    print(f"⚠️  Could not create index {keys} on {name}: {e}")
+            for index_name in RETIRED_INDEXES.get(name, ()):
+                try:
+                    await db[name].drop_index(index_name)
+                except OperationFailure:
+                    pass  # already gone
+        _indexes_ready = True
+
+
+async def ensure_indexes_with_retry(initial_delay: float = 1, max_delay: float = 60):
+    """Keep calling ensure_indexes() with backoff until MongoDB is reachable."""
+    delay = initial_delay
+    while True:
+        try:
+            await ensure_indexes()
+            print("✅ MongoDB indexes ready")
+            return
+        except PyMongoError as e:
+            print(f"⚠️  Index creation failed, retrying in {delay}s: {e}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
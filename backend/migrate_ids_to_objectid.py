@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+ID Migration Script
+Rewrites legacy UUID string _ids on notes, papers and syllabus to ObjectIds.
+Required before running the API: routes only accept ObjectId ids.
+Safe to re-run; each copy records its old id in `legacy_id`.
+"""
+
+import sys
+from pymongo import MongoClient
+from config import MONGO_URI, DATABASE_NAME
+
+COLLECTIONS = ("notes", "papers", "syllabus")
+
+def migrate_collection(db, name):
+    """Re-insert every string-keyed document under a fresh ObjectId"""
+    # Unique so an interrupted run can never leave two copies of one document
+    db[name].create_index("legacy_id", unique=True, sparse=True)
+    migrated = 0
+    for doc in db[name].find({"_id": {"$type": "string"}}):
+        old_id = doc.pop("_id")
+        # Upsert on legacy_id: a copy left by an earlier, interrupted run is reused
+        db[name].update_one({"legacy_id": old_id}, {"$setOnInsert": doc}, upsert=True)
+        db[name].delete_one({"_id": old_id})
+        migrated += 1
+    return migrated
+
+def main():
+    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
+    db = client[DATABASE_NAME]
+
+    print("\n" + "="*70)
+    print("🔁 Migrating UUID string ids to ObjectId")
+    print("="*70)
+
+    for name in COLLECTIONS:
+        count = migrate_collection(db, name)
+        print(f"   {name}: {count} document(s) migrated")
+
+    print("="*70 + "\n")
+    client.close()
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+        sys.exit(1)
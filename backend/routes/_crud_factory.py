@@ -0,0 +1,282 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, Optional, Sequence, Type
+from bson import ObjectId
+from fastapi import APIRouter, HTTPException, Depends, Query, Body
+from fastapi.responses import ORJSONResponse
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pydantic import BaseModel
+from pymongo.errors import BulkWriteError, OperationFailure
+from config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_BULK_SIZE
+from database import SEARCH_FIELDS, ensure_indexes, get_db
+from routes.auth_utils import verify_admin
+from routes._ids import parse_object_id
+from routes._item_cache import get_item_cache, invalidate_item
+from routes._pagination import CURSOR_SORT, cursor_filter, split_page
+from routes._projection import build_projection
+from routes._search import TEXT_SCORE, TEXT_SCORE_SORT, build_search_filter
+from routes._serializers import serialize
+
+# Server error code for a $text query without a text index
+INDEX_NOT_FOUND = 27
+
+def make_crud_router(
+    name: str,
+    model_in: Type[BaseModel],
+    label: str,
+    plural: Optional[str] = None,
+    list_excluded_fields: Sequence[str] = (),
+) -> APIRouter:
+    """Build the list/search/CRUD router for one resource collection.
+
+    `name` is the MongoDB collection (and SEARCH_FIELDS key), `label` the singular
+    display name used in messages ("Note"), `plural` the lowercase plural used in
+    messages (defaults to name). Heavy fields in `list_excluded_fields` are
+    projected out of list/search responses unless requested via ?fields=.
+    """
+    plural = plural or name
+    singular = label.lower()
+    not_found = f"{label} not found"
+    search_fields = SEARCH_FIELDS[name]
+    logger = logging.getLogger(f"routes.{name}_routes")
+    router = APIRouter()
+    # Serialized GET /{id} responses; only touched from the event loop, so no lock.
+    # Other worker processes keep their own copy until the TTL lapses.
+    item_cache = get_item_cache(name)
+
+    @router.get("/", summary=f"Get all {plural} with pagination")
+    async def list_items(
+        after: Optional[str] = Query(None, description="Opaque cursor from pagination.next_cursor"),
+        skip: int = Query(0, ge=0, deprecated=True),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        fields: Optional[str] = Query(None, description="Comma separated fields to return"),
+        db: AsyncIOMotorDatabase = Depends(get_db),
+    ):
+        try:
+            if after and skip:
+                raise HTTPException(status_code=400, detail="Use either after or skip, not both")
+            projection = build_projection(fields, list_excluded_fields)
+            query = cursor_filter(after) if after else {}
+            cursor = db[name].find(query, projection).sort(CURSOR_SORT).skip(skip)
+            # Count and page fetch are independent round trips; run them concurrently.
+            # The unfiltered total comes from collection metadata rather than a scan.
+            total, docs = await asyncio.gather(
+                db[name].estimated_document_count(),
+                cursor.limit(limit + 1).to_list(length=limit + 1),
+            )
+            has_more = len(docs) > limit
+            docs, next_cursor = split_page(docs, limit)
+            logger.info("Retrieved %d %s (skip=%d, limit=%d)", len(docs), plural, skip, limit)
+            default_now = datetime.utcnow()
+            docs = [serialize(doc, default_now) for doc in docs]
+            # Returned as a response so FastAPI skips jsonable_encoder; orjson handles datetimes
+            return ORJSONResponse({
+                "success": True,
+                "data": docs,
+                "pagination": {
+                    "total": total,
+                    "skip": skip,
+                    "limit": limit,
+                    "returned": len(docs),
+                    "has_more": has_more,
+                    "next_cursor": next_cursor
+                }
+            })
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Error fetching %s: %s", plural, e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @router.get("/search", summary=f"Search {plural} by {', '.join(search_fields)}")
+    async def search_items(
+        q: str = Query(..., min_length=1),
+        order: str = Query("relevance", pattern="^(relevance|recent)$"),
+        after: Optional[str] = Query(None, description="Opaque cursor from pagination.next_cursor (order=recent)"),
+        skip: int = Query(0, ge=0),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        fields: Optional[str] = Query(None, description="Comma separated fields to return"),
+        include_total: bool = Query(True, description="Set false to skip counting matches"),
+        db: AsyncIOMotorDatabase = Depends(get_db),
+    ):
+        try:
+            if after and skip:
+                raise HTTPException(status_code=400, detail="Use either after or skip, not both")
+            projection = build_projection(fields, list_excluded_fields)
+            search_filter, ranked = build_search_filter(q, search_fields)
+            ranked = ranked and order == "relevance"
+            if ranked and after:
+                # Relevance order has no keyset cursor; ignoring `after` would silently return page 1
+                raise HTTPException(status_code=400, detail="after requires order=recent")
+
+            async def fetch():
+                if ranked:
+                    # Relevance order is not range-seekable, so ranked results page with skip
+                    cursor = db[name].find(search_filter, {**projection, **TEXT_SCORE}).sort(TEXT_SCORE_SORT).skip(skip)
+                else:
+                    query = {"$and": [search_filter, cursor_filter(after)]} if after else search_filter
+                    cursor = db[name].find(query, projection).sort(CURSOR_SORT).skip(skip)
+                page = cursor.limit(limit + 1).to_list(length=limit + 1)
+                if include_total:
+                    # Count and page fetch are independent round trips; run them concurrently
+                    return await asyncio.gather(db[name].count_documents(search_filter), page)
+                return None, await page
+
+            try:
+                total, docs = await fetch()
+            except OperationFailure as e:
+                if e.code != INDEX_NOT_FOUND:
+                    raise
+                # $text needs the text index; build it now if startup could not, then retry
+                await ensure_indexes()
+                total, docs = await fetch()
+
+            has_more = len(docs) > limit
+            docs, next_cursor = split_page(docs, limit, keyset=not ranked)
+            logger.info("Search '%s': found %d %s", q, len(docs), plural)
+            default_now = datetime.utcnow()
+            docs = [serialize(doc, default_now) for doc in docs]
+            return ORJSONResponse({
+                "success": True,
+                "query": q,
+                "data": docs,
+                "pagination": {
+                    "total": total,
+                    "skip": skip,
+                    "limit": limit,
+                    "returned": len(docs),
+                    "has_more": has_more,
+                    "next_cursor": next_cursor
+                }
+            })
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Search error: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @router.post("/", dependencies=[Depends(verify_admin)], summary=f"Create {singular} (admin only)")
+    async def create_item(payload: model_in, db: AsyncIOMotorDatabase = Depends(get_db)):
+        try:
+            now = datetime.utcnow()
+            doc = payload.model_dump()
+            doc.update({
+                "created_at": now,
+                "updated_at": now
+            })
+            await db[name].insert_one(doc)
+            # insert_one fills in the generated ObjectId as doc["_id"]
+            item_id = str(doc.pop("_id"))
+            logger.info("%s created: %s", label, item_id)
+            return {
+                "success": True,
+                "message": f"{label} created successfully",
+                "data": {"id": item_id, **doc}
+            }
+        except Exception as e:
+            logger.error("%s creation error: %s", label, e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @router.post("/bulk", dependencies=[Depends(verify_admin)], summary=f"Bulk create {plural} (admin only)")
+    async def bulk_create_items(
+        payloads: List[model_in] = Body(..., min_length=1, max_length=MAX_BULK_SIZE),
+        db: AsyncIOMotorDatabase = Depends(get_db),
+    ):
+        try:
+            now = datetime.utcnow()
+            docs = [
+                {**payload.model_dump(), "_id": ObjectId(), "created_at": now, "updated_at": now}
+                for payload in payloads
+            ]
+            # One round trip for the whole batch; unordered so one bad doc doesn't stop the rest
+            await db[name].insert_many(docs, ordered=False)
+            ids = [str(doc["_id"]) for doc in docs]
+            logger.info("Bulk created %d %s", len(ids), plural)
+            return {
+                "success": True,
+                "message": f"{len(ids)} {plural} created successfully",
+                "data": {"ids": ids}
+            }
+        except BulkWriteError as e:
+            # Unordered inserts keep going past failures, so report what did land
+            write_errors = e.details.get("writeErrors", [])
+            failed = {err["index"] for err in write_errors}
+            ids = [str(doc["_id"]) for i, doc in enumerate(docs) if i not in failed]
+            errors = [
+                {"index": err["index"], "id": str(docs[err["index"]]["_id"]), "message": err.get("errmsg")}
+                for err in write_errors
+            ]
+            logger.warning("Bulk created %d of %d %s; %d failed", len(ids), len(docs), plural, len(errors))
+            return ORJSONResponse(status_code=207, content={
+                "success": False,
+                "message": f"{len(ids)} of {len(docs)} {plural} created",
+                "data": {"ids": ids, "errors": errors}
+            })
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Bulk %s creation error: %s", singular, e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @router.get("/{item_id}", summary=f"Get specific {singular}")
+    async def get_item(item_id: str, db: AsyncIOMotorDatabase = Depends(get_db)):
+        try:
+            oid = parse_object_id(item_id, not_found)
+            doc = item_cache.get(oid)
+            if doc is None:
+                generation = item_cache.begin_fetch(oid)
+                try:
+                    doc = await db[name].find_one({"_id": oid})
+                    if doc:
+                        doc = serialize(doc, datetime.utcnow())
+                finally:
+                    item_cache.end_fetch(oid, generation, doc)
+                if not doc:
+                    raise HTTPException(status_code=404, detail=not_found)
+            logger.info("%s retrieved: %s", label, item_id)
+            return ORJSONResponse({"success": True, "data": doc})
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Error fetching %s %s: %s", singular, item_id, e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @router.put("/{item_id}", dependencies=[Depends(verify_admin)], summary=f"Update {singular} (admin only)")
+    async def update_item(item_id: str, payload: model_in, db: AsyncIOMotorDatabase = Depends(get_db)):
+        try:
+            update_data = payload.model_dump(exclude_unset=True)
+            update_data["updated_at"] = datetime.utcnow()
+            oid = parse_object_id(item_id, not_found)
+            result = await db[name].update_one({"_id": oid}, {"$set": update_data})
+            invalidate_item(name, oid)
+            if result.matched_count == 0:
+                raise HTTPException(status_code=404, detail=not_found)
+            logger.info("%s updated: %s", label, item_id)
+            return {
+                "success": True,
+                "message": f"{label} updated successfully"
+            }
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("%s update error: %s", label, e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @router.delete("/{item_id}", dependencies=[Depends(verify_admin)], summary=f"Delete {singular} (admin only)")
+    async def delete_item(item_id: str, db: AsyncIOMotorDatabase = Depends(get_db)):
+        try:
+            oid = parse_object_id(item_id, not_found)
+            result = await db[name].delete_one({"_id": oid})
+            invalidate_item(name, oid)
+            if result.deleted_count == 0:
+                raise HTTPException(status_code=404, detail=not_found)
+            logger.info("%s deleted: %s", label, item_id)
+            return {"success": True, "message": f"{label} deleted successfully"}
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("%s deletion error: %s", label, e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    return router
@@ -0,0 +1,8 @@
+from bson import ObjectId
+from fastapi import HTTPException
+
+def parse_object_id(raw: str, detail: str = "Not found") -> ObjectId:
+    """Convert a path id to an ObjectId; a malformed id cannot match, so it 404s."""
+    if len(raw) != 24 or not ObjectId.is_valid(raw):
+        raise HTTPException(status_code=404, detail=detail)
+    return ObjectId(raw)
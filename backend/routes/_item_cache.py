@@ -0,0 +1,53 @@
+from typing import Any, Dict, Optional
+from bson import ObjectId
+from cachetools import TTLCache
+from config import ITEM_CACHE_SIZE, ITEM_CACHE_TTL
+
+class ItemCache:
+    """Per-collection cache of serialized documents for GET /{id}.
+
+    A fetch records the key's generation before awaiting the database and only
+    stores its result if no invalidation bumped the generation in the meantime,
+    so a write that lands mid-fetch cannot be overwritten by the stale read.
+    Generations are tracked only while a fetch for the key is in flight.
+    """
+
+    def __init__(self) -> None:
+        self._docs: TTLCache = TTLCache(maxsize=ITEM_CACHE_SIZE, ttl=ITEM_CACHE_TTL)
+        # key -> [generation, in-flight fetch count]
+        self._inflight: Dict[ObjectId, list] = {}
+
+    def get(self, key: ObjectId) -> Optional[Dict[str, Any]]:
+        return self._docs.get(key)
+
+    def begin_fetch(self, key: ObjectId) -> int:
+        entry = self._inflight.setdefault(key, [0, 0])
+        entry[1] += 1
+        return entry[0]
+
+    def end_fetch(self, key: ObjectId, generation: int, doc: Optional[Dict[str, Any]]) -> None:
+        entry = self._inflight[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._inflight[key]
+        if doc is not None and entry[0] == generation:
+            self._docs[key] = doc
+
+    def invalidate(self, key: ObjectId) -> None:
+        self._docs.pop(key, None)
+        entry = self._inflight.get(key)
+        if entry is not None:
+            entry[0] += 1
+
+_caches: Dict[str, ItemCache] = {}
+
+def get_item_cache(collection: str) -> ItemCache:
+    """Return the shared item cache for a collection, creating it on first use."""
+    cache = _caches.get(collection)
+    if cache is None:
+        cache = _caches[collection] = ItemCache()
+    return cache
+
+def invalidate_item(collection: str, item_id: ObjectId) -> None:
+    """Drop a cached document after any write to it, wherever the write happens."""
+    get_item_cache(collection).invalidate(item_id)
@@ -0,0 +1,46 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+from bson import ObjectId
+from fastapi import HTTPException
+
+# Keyset order for list endpoints; backed by the created_at_-1__id_-1 index
+CURSOR_SORT = [("created_at", -1), ("_id", -1)]
+
+def encode_cursor(doc: dict) -> Optional[str]:
+    created_at = doc.get("created_at")
+    # decode_cursor only accepts ObjectIds, so never hand out a cursor it would reject
+    if created_at is None or not isinstance(doc["_id"], ObjectId):
+        return None
+    payload = {"created_at": created_at.isoformat(), "id": str(doc["_id"])}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+def decode_cursor(token: str) -> Tuple[datetime, ObjectId]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+        last_id = payload["id"]
+        # Legacy string ids are rewritten by migrate_ids_to_objectid.py, so only ObjectIds remain
+        if len(last_id) != 24 or not ObjectId.is_valid(last_id):
+            raise ValueError(last_id)
+        return datetime.fromisoformat(payload["created_at"]), ObjectId(last_id)
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def cursor_filter(after: str) -> dict:
+    """Range filter selecting documents strictly after the cursor position."""
+    ts, last_id = decode_cursor(after)
+    return {"$or": [
+        {"created_at": {"$lt": ts}},
+        {"created_at": ts, "_id": {"$lt": last_id}},
+    ]}
+
+def split_page(docs: List[dict], limit: int, keyset: bool = True) -> Tuple[List[dict], Optional[str]]:
+    """Trim a limit + 1 over-fetch to one page and build the cursor for the next.
+
+    Pass keyset=False for result orders other than CURSOR_SORT; no cursor is built.
+    """
+    if len(docs) <= limit:
+        return docs, None
+    page = docs[:limit]
+    return page, encode_cursor(page[-1]) if keyset else None
@@ -0,0 +1,23 @@
+import re
+from typing import Optional, Sequence
+from fastapi import HTTPException
+
+FIELD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Always returned: serialization and cursor pagination depend on them
+ALWAYS_INCLUDED = ("created_at", "updated_at")
+
+def build_projection(fields: Optional[str], excluded: Sequence[str]) -> dict:
+    """Projection for list/search endpoints.
+
+    By default the collection's heavy fields are left out (clients fetch them via
+    /{id}); a comma separated `fields` value selects an explicit set instead.
+    """
+    if not fields:
+        return {field: 0 for field in excluded}
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    if not requested or not all(FIELD_RE.fullmatch(field) for field in requested):
+        raise HTTPException(status_code=400, detail="Invalid fields parameter")
+    projection = {field: 1 for field in requested}
+    projection.update({field: 1 for field in ALWAYS_INCLUDED})
+    return projection
@@ -0,0 +1,28 @@
+import re
+from typing import Sequence, Tuple
+from bson import Regex
+from fastapi import HTTPException
+
+TEXT_SCORE = {"score": {"$meta": "textScore"}}
+TEXT_SCORE_SORT = [("score", {"$meta": "textScore"})]
+
+# Only "*" is a wildcard; "?" is left alone so ordinary questions still use $text
+WILDCARD = "*"
+
+def build_search_filter(q: str, fields: Sequence[str]) -> Tuple[dict, bool]:
+    """Return (filter, uses_text_index) for a user search query.
+
+    Plain queries go through the collection's text index. A query ending in the
+    wildcard falls back to an anchored prefix regex; only trailing wildcards are
+    supported.
+    """
+    if WILDCARD not in q:
+        return {"$text": {"$search": q}}, True
+    prefix = q.rstrip(WILDCARD)
+    if WILDCARD in prefix:
+        raise HTTPException(status_code=400, detail="Only a trailing * wildcard is supported")
+    if not prefix:
+        raise HTTPException(status_code=400, detail="Wildcard searches need a leading prefix")
+    # A BSON Regex value is sent as-is instead of being rebuilt from $regex/$options
+    pattern = Regex(f"^{re.escape(prefix)}", "i")
+    return {"$or": [{field: pattern} for field in fields]}, False
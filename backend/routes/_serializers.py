@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Any, Dict
+
+# Kept free of FastAPI/Motor imports and fully annotated so the Docker build can
+# compile it with mypyc; the pure-Python module is used when it isn't compiled.
+
+def serialize(doc: Dict[str, Any], default_now: datetime) -> Dict[str, Any]:
+    """Shape a MongoDB document for a JSON response (mutates and returns doc).
+
+    Timestamps stay as datetime objects; ORJSONResponse encodes them natively.
+    `default_now` fills missing timestamps on legacy documents and is captured
+    once per request by the caller rather than per document.
+    """
+    doc["id"] = str(doc.pop("_id"))
+    if doc.get("created_at") is None:
+        doc["created_at"] = default_now
+    if doc.get("updated_at") is None:
+        doc["updated_at"] = default_now
+    return doc
@@ -1,14 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Body, Request
-from jose import jwt, JWTError
-from config import JWT_SECRET_KEY, JWT_ALGORITHM
-from config import db
+from jwt import PyJWTError
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from database import get_db
+from routes.auth_utils import decode_token
+from routes._ids import parse_object_id
+from routes._item_cache import invalidate_item
 from datetime import datetime
-import uuid
+import asyncio
 from typing import Optional
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
-def get_current_user(request: Request):
+async def get_current_user(request: Request, db: AsyncIOMotorDatabase = Depends(get_db)):
     token = None
 
     # Read token from cookie or Authorization header
@@ -22,16 +25,16 @@ def get_current_user(request: Request):
         raise HTTPException(status_code=401, detail="Missing authentication token")
 
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = decode_token(token)
         email = payload.get("sub")
         if not email:
             raise HTTPException(status_code=401, detail="Invalid token payload")
 
-        user = db.users.find_one({"email": email})
+        user = await db.users.find_one({"email": email})
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         return user
-    except JWTError:
+    except PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
 def is_admin_user(user: dict):
@@ -40,13 +43,15 @@ def is_admin_user(user: dict):
 
 # Admin Dashboard
 @router.get("/dashboard")
-async def admin_dashboard(current_user=Depends(get_current_user)):
+async def admin_dashboard(current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admins only")
 
-    total_users = db.users.count_documents({})
-    total_admins = db.users.count_documents({"is_admin": True})
-    total_students = db.users.count_documents({"role": "student"})
+    total_users, total_admins, total_students = await asyncio.gather(
+        db.users.estimated_document_count(),
+        db.users.count_documents({"is_admin": True}),
+        db.users.count_documents({"role": "student"}),
+    )
     return {
         "message": f"Welcome Admin {current_user.get('name')}",
         "stats": {
@@ -58,145 +63,164 @@ async def admin_dashboard(current_user=Depends(get_current_user)):
 
 # Notes endpoints
 @router.post("/notes")
-async def add_notes(current_user=Depends(get_current_user), data: dict = Body(...)):
+async def add_notes(current_user=Depends(get_current_user), data: dict = Body(...), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
     if not data.get("title") or not data.get("content"):
         raise HTTPException(status_code=400, detail="Missing title or content")
     note = {
-        "_id": str(uuid.uuid4()),
         "title": data["title"],
         "content": data["content"],
         "tags": data.get("tags", []),
         "created_by": current_user["email"],
         "created_at": datetime.utcnow()
     }
-    db.notes.insert_one(note)
+    await db.notes.insert_one(note)
+    note["_id"] = str(note["_id"])
     return {"message": "Note added successfully", "note": note}
 
 @router.get("/notes")
-async def list_notes(skip: int = 0, limit: int = 50, current_user=Depends(get_current_user)):
+async def list_notes(skip: int = 0, limit: int = 50, current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
     cursor = db.notes.find().sort("created_at", -1).skip(skip).limit(limit)
-    return {"notes": list(cursor)}
+    notes = await cursor.to_list(length=limit)
+    for note in notes:
+        note["_id"] = str(note["_id"])
+    return {"notes": notes}
 
 @router.put("/notes/{note_id}")
-async def update_note(note_id: str, data: dict = Body(...), current_user=Depends(get_current_user)):
+async def update_note(note_id: str, data: dict = Body(...), current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
     update = {k: v for k, v in data.items() if k in ("title", "content", "tags")}
     if not update:
         raise HTTPException(status_code=400, detail="No fields to update")
     update["updated_at"] = datetime.utcnow()
-    result = db.notes.update_one({"_id": note_id}, {"$set": update})
+    oid = parse_object_id(note_id, "Note not found")
+    result = await db.notes.update_one({"_id": oid}, {"$set": update})
+    invalidate_item("notes", oid)
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Note not found")
     return {"message": "Note updated successfully"}
 
 @router.delete("/notes/{note_id}")
-async def delete_note(note_id: str, current_user=Depends(get_current_user)):
+async def delete_note(note_id: str, current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
-    result = db.notes.delete_one({"_id": note_id})
+    oid = parse_object_id(note_id, "Note not found")
+    result = await db.notes.delete_one({"_id": oid})
+    invalidate_item("notes", oid)
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Note not found")
     return {"message": "Note deleted successfully"}
 
 # Syllabus endpoints
 @router.post("/syllabus")
-async def add_syllabus(current_user=Depends(get_current_user), data: dict = Body(...)):
+async def add_syllabus(current_user=Depends(get_current_user), data: dict = Body(...), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
     required = ("course", "semester", "topics")
     if not all(data.get(k) for k in required):
         raise HTTPException(status_code=400, detail="Missing syllabus details")
     syllabus = {
-        "_id": str(uuid.uuid4()),
         "course": data["course"],
         "semester": data["semester"],
         "topics": data["topics"],
         "created_by": current_user["email"],
         "created_at": datetime.utcnow()
     }
-    db.syllabus.insert_one(syllabus)
+    await db.syllabus.insert_one(syllabus)
+    syllabus["_id"] = str(syllabus["_id"])
     return {"message": "Syllabus added successfully", "syllabus": syllabus}
 
 @router.get("/syllabus")
-async def list_syllabus(course: Optional[str] = None, current_user=Depends(get_current_user)):
+async def list_syllabus(course: Optional[str] = None, current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
     query = {}
     if course:
         query["course"] = course
-    docs = list(db.syllabus.find(query).sort("created_at", -1))
+    docs = await db.syllabus.find(query).sort("created_at", -1).to_list(length=None)
+    for doc in docs:
+        doc["_id"] = str(doc["_id"])
     return {"syllabus": docs}
 
 @router.put("/syllabus/{sid}")
-async def update_syllabus(sid: str, data: dict = Body(...), current_user=Depends(get_current_user)):
+async def update_syllabus(sid: str, data: dict = Body(...), current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
     update = {k: v for k, v in data.items() if k in ("course", "semester", "topics")}
     if not update:
         raise HTTPException(status_code=400, detail="No fields to update")
     update["updated_at"] = datetime.utcnow()
-    res = db.syllabus.update_one({"_id": sid}, {"$set": update})
+    oid = parse_object_id(sid, "Syllabus not found")
+    res = await db.syllabus.update_one({"_id": oid}, {"$set": update})
+    invalidate_item("syllabus", oid)
     if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="Syllabus not found")
     return {"message": "Syllabus updated successfully"}
 
 @router.delete("/syllabus/{sid}")
-async def delete_syllabus(sid: str, current_user=Depends(get_current_user)):
+async def delete_syllabus(sid: str, current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
-    res = db.syllabus.delete_one({"_id": sid})
+    oid = parse_object_id(sid, "Syllabus not found")
+    res = await db.syllabus.delete_one({"_id": oid})
+    invalidate_item("syllabus", oid)
     if res.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Syllabus not found")
     return {"message": "Syllabus deleted successfully"}
 
 # Papers endpoints
 @router.post("/papers")
-async def add_paper(current_user=Depends(get_current_user), data: dict = Body(...)):
+async def add_paper(current_user=Depends(get_current_user), data: dict = Body(...), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
     if not data.get("title") or not data.get("file_url"):
         raise HTTPException(status_code=400, detail="Missing title or file_url")
     paper = {
-        "_id": str(uuid.uuid4()),
         "title": data["title"],
         "description": data.get("description"),
         "file_url": data["file_url"],
         "created_by": current_user["email"],
         "created_at": datetime.utcnow()
     }
-    db.papers.insert_one(paper)
+    await db.papers.insert_one(paper)
+    paper["_id"] = str(paper["_id"])
     return {"message": "Paper added successfully", "paper": paper}
 
 @router.get("/papers")
-async def list_papers(skip: int = 0, limit: int = 50, current_user=Depends(get_current_user)):
+async def list_papers(skip: int = 0, limit: int = 50, current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
-    docs = list(db.papers.find().sort("created_at", -1).skip(skip).limit(limit))
+    docs = await db.papers.find().sort("created_at", -1).skip(skip).limit(limit).to_list(length=limit)
+    for doc in docs:
+        doc["_id"] = str(doc["_id"])
     return {"papers": docs}
 
 @router.put("/papers/{pid}")
-async def update_paper(pid: str, data: dict = Body(...), current_user=Depends(get_current_user)):
+async def update_paper(pid: str, data: dict = Body(...), current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
     update = {k: v for k, v in data.items() if k in ("title", "description", "file_url")}
     if not update:
         raise HTTPException(status_code=400, detail="No fields to update")
     update["updated_at"] = datetime.utcnow()
-    res = db.papers.update_one({"_id": pid}, {"$set": update})
+    oid = parse_object_id(pid, "Paper not found")
+    res = await db.papers.update_one({"_id": oid}, {"$set": update})
+    invalidate_item("papers", oid)
     if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="Paper not found")
     return {"message": "Paper updated successfully"}
 
 @router.delete("/papers/{pid}")
-async def delete_paper(pid: str, current_user=Depends(get_current_user)):
+async def delete_paper(pid: str, current_user=Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
     if not is_admin_user(current_user):
         raise HTTPException(status_code=403, detail="Admins only")
-    res = db.papers.delete_one({"_id": pid})
+    oid = parse_object_id(pid, "Paper not found")
+    res = await db.papers.delete_one({"_id": oid})
+    invalidate_item("papers", oid)
     if res.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Paper not found")
     return {"message": "Paper deleted successfully"}
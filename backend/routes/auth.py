@@ -1,11 +1,12 @@
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, EmailStr
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
+import jwt
+from jwt import PyJWTError
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from config import (
-    db,
     JWT_SECRET_KEY as SECRET_KEY,
     JWT_ALGORITHM as ALGORITHM,
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -22,6 +23,8 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import uuid
 import logging
+from database import get_db
+from routes.auth_utils import decode_token
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -84,20 +87,18 @@ def send_verification_email(to_email: str, token: str):
             server.starttls()
             server.login(SMTP_USERNAME, SMTP_PASSWORD)
             server.sendmail(SMTP_FROM_EMAIL, to_email, message.as_string())
-            logger.info(f"Verification email sent to {to_email}")
+            logger.info("Verification email sent to %s", to_email)
     except Exception as e:
-        logger.error(f"Email sending failed: {e}")
+        logger.error("Email sending failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to send verification email: {e}")
 
 @router.post("/register")
-async def register_user(data: RegisterModel):
-    if db is None:
-        raise HTTPException(status_code=500, detail="Database not connected")
-    existing_user = db.users.find_one({"email": data.email})
+async def register_user(data: RegisterModel, db: AsyncIOMotorDatabase = Depends(get_db)):
+    existing_user = await db.users.find_one({"email": data.email})
     if existing_user and existing_user.get("verified", False):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered and verified")
     if existing_user and not existing_user.get("verified", False):
-        db.users.delete_one({"email": data.email})
+        await db.users.delete_one({"email": data.email})
     hashed_pw = pwd_context.hash(data.password)
     token_data = {
         "name": data.name,
@@ -115,22 +116,22 @@ async def register_user(data: RegisterModel):
         "verified": False,
         "created_at": datetime.utcnow()
     }
-    db.users.insert_one(pending)
-    logger.info(f"Pending user registration started for {data.email}")
+    await db.users.insert_one(pending)
+    logger.info("Pending user registration started for %s", data.email)
     return {"message": "Verification email sent successfully. Please verify to complete registration."}
 
 @router.get("/verify/{token}", response_class=HTMLResponse)
-async def verify_email(token: str):
+async def verify_email(token: str, db: AsyncIOMotorDatabase = Depends(get_db)):
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    except JWTError:
+        payload = decode_token(token)
+    except PyJWTError:
         raise HTTPException(status_code=400, detail="Invalid or expired verification link")
     email = payload.get("email")
     name = payload.get("name")
     password_hash = payload.get("password_hash")
     if not email or not name or not password_hash:
         raise HTTPException(status_code=400, detail="Invalid token payload")
-    db.users.delete_many({"email": email})
+    await db.users.delete_many({"email": email})
     user_doc = {
         "_id": str(uuid.uuid4()),
         "name": name,
@@ -145,7 +146,7 @@ async def verify_email(token: str):
         "verified_at": datetime.utcnow(),
         "created_at": datetime.utcnow(),
     }
-    db.users.insert_one(user_doc)
+    await db.users.insert_one(user_doc)
     redirect_url = f"{FRONTEND_URL.rstrip('/')}/login"
     html = f"""
     <html><body style='font-family: sans-serif; text-align:center; padding:40px;'>
@@ -155,14 +156,12 @@ async def verify_email(token: str):
       <meta http-equiv="refresh" content="3;url={redirect_url}" />
     </body></html>
     """
-    logger.info(f"User verified and created: {email}")
+    logger.info("User verified and created: %s", email)
     return HTMLResponse(content=html, status_code=200)
 
 @router.post("/login")
-async def login_user(data: LoginModel):
-    if db is None:
-        raise HTTPException(status_code=500, detail="Database not connected")
-    user = db.users.find_one({"email": data.email})
+async def login_user(data: LoginModel, db: AsyncIOMotorDatabase = Depends(get_db)):
+    user = await db.users.find_one({"email": data.email})
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     if not user.get("verified", False):
@@ -181,16 +180,15 @@ async def login_user(data: LoginModel):
         "is_admin": is_admin,
         "role": user.get("role", "student"),
     }
-    logger.info(f"User logged in: {data.email}")
+    logger.info("User logged in: %s", data.email)
     return {"access_token": token, "token_type": "bearer", "user": user_response}
 
 @router.post("/resend-verification")
 async def resend_verification(
     data: ResendVerificationModel, background_tasks: BackgroundTasks,
+    db: AsyncIOMotorDatabase = Depends(get_db),
 ):
-    if db is None:
-        raise HTTPException(status_code=500, detail="Database not connected")
-    user = db.users.find_one({"email": data.email})
+    user = await db.users.find_one({"email": data.email})
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     if user.get("verified", False):
@@ -209,5 +207,5 @@ async def resend_verification(
     }
     verification_token = create_access_token(token_data, expires_minutes=15)
     background_tasks.add_task(send_verification_email, data.email, verification_token)
-    logger.info(f"Resent verification email: {data.email}")
+    logger.info("Resent verification email: %s", data.email)
     return {"message": "Verification email resent successfully."}
@@ -1,32 +1,65 @@
+import hashlib
 import logging
+import threading
+import time
+import jwt
+from cachetools import TTLCache
 from fastapi import HTTPException, Request
-from jose import jwt, JWTError
-from config import JWT_SECRET_KEY, JWT_ALGORITHM
+from jwt import PyJWTError
+from config import JWT_SECRET_KEY, JWT_ALGORITHM, JWT_CACHE_SIZE, JWT_CACHE_TTL
 
 logger = logging.getLogger(__name__)
 
+# Resolved once rather than on every decode: the accepted algorithms, the prepared
+# verification key (bytes for HMAC, a public key object for RSA/EC) and the claim options
+JWT_ALGORITHMS = (JWT_ALGORITHM,)
+_jwt_key = jwt.get_algorithm_by_name(JWT_ALGORITHM).prepare_key(JWT_SECRET_KEY)
+# For RS*/ES* the shared secret is the private signing key; verification needs its public half
+if hasattr(_jwt_key, "public_key"):
+    _jwt_key = _jwt_key.public_key()
+_jwt_options = {"require": ["exp"]}
+
+# Keyed by a truncated sha256 of the token so raw tokens are never held in memory
+_jwt_cache = TTLCache(maxsize=JWT_CACHE_SIZE, ttl=JWT_CACHE_TTL)
+_jwt_cache_lock = threading.Lock()
+
+def decode_token(token: str) -> dict:
+    """Decode and verify a JWT, reusing a recent verification of the same token."""
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    # A cached payload skips the signature check but must still be unexpired
+    if payload is not None and payload["exp"] > time.time():
+        return payload
+    payload = jwt.decode(token, _jwt_key, algorithms=JWT_ALGORITHMS, options=_jwt_options)
+    with _jwt_cache_lock:
+        _jwt_cache[key] = payload
+    return payload
+
 def verify_admin(request: Request):
     token = request.cookies.get("token")
     if not token:
-        logger.warning("Admin verification failed: Missing token cookie")
         raise HTTPException(status_code=401, detail="Missing authentication token")
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        if not payload.get("is_admin"):
-            logger.warning(f"Admin verification failed: Non-admin user {payload.get('sub')}")
-            raise HTTPException(status_code=403, detail="Admin access required")
-        return payload
-    except JWTError as e:
-        logger.error(f"Token verification error: {str(e)}")
+        payload = decode_token(token)
+    except PyJWTError as e:
+        logger.error("Token verification error: %s", e)
         raise HTTPException(status_code=401, detail="Invalid token")
+    try:
+        if payload["is_admin"]:
+            return payload
+    except KeyError:
+        pass
+    logger.warning("Admin verification failed: Non-admin user %s", payload.get("sub"))
+    raise HTTPException(status_code=403, detail="Admin access required")
 
 def verify_token(request: Request):
     token = request.cookies.get("token")
     if not token:
         raise HTTPException(status_code=401, detail="Missing authentication token")
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = decode_token(token)
         return payload
-    except JWTError:
+    except PyJWTError:
         logger.error("Token verification failed")
         raise HTTPException(status_code=401, detail="Invalid token")
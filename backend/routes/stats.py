@@ -1,16 +1,17 @@
 # routes/stats.py
-from fastapi import APIRouter
-from database import db
+from fastapi import APIRouter, Depends
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from database import get_db
 from bson import ObjectId
 
 router = APIRouter(prefix="/api/stats", tags=["Stats"])
 
 @router.get("/")
-async def get_stats():
-    total_users = db.users.count_documents({})
+async def get_stats(db: AsyncIOMotorDatabase = Depends(get_db)):
+    total_users = await db.users.estimated_document_count()
     recent_users_cursor = db.users.find().sort("created_at", -1).limit(5)
     recent_users = []
-    for u in recent_users_cursor:
+    async for u in recent_users_cursor:
         u["_id"] = str(u["_id"])
         # avoid returning password
         u.pop("password", None)
@@ -6,25 +6,30 @@ dotenv_path = Path(__file__).resolve().parent / ".env"
 print(f"Loading .env from: {dotenv_path}")
 load_dotenv(dotenv_path)
 
+import asyncio
 import uuid
 import logging
 from datetime import datetime, timedelta
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 from pydantic import BaseModel, EmailStr
 import importlib
 import pkgutil
+from contextlib import asynccontextmanager
 
 from config import (
-    db,
     JWT_SECRET_KEY,
     JWT_ALGORITHM,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     ALLOWED_ORIGINS,
 )
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from database import get_db, ping_database, ensure_indexes_with_retry
+from routes.auth_utils import decode_token
 
 LOG_DIR = os.path.join(os.getcwd(), "app_logging", "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -50,15 +55,27 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
 
 def verify_token(token: str):
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = decode_token(token)
         return payload
-    except JWTError:
+    except PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await ping_database()
+    # Build indexes in the background so a MongoDB that starts after the app
+    # still gets them; search also builds them on demand if this is still pending
+    index_task = asyncio.create_task(ensure_indexes_with_retry())
+    yield
+    index_task.cancel()
+
 app = FastAPI(
     title="EduResources API",
     description="Academic Resources Management System",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson encodes datetimes natively, so handlers return them unconverted
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -82,15 +99,12 @@ class UserLogin(BaseModel):
     password: str
 
 @app.post("/api/auth/register", tags=["Authentication"])
-async def register(user: UserRegister):
-    if db is None:
-        logger.error("Database not connected during registration")
-        raise HTTPException(status_code=500, detail="Database not connected")
+async def register(user: UserRegister, db: AsyncIOMotorDatabase = Depends(get_db)):
     try:
         users_collection = db.users
-        existing_user = users_collection.find_one({"email": user.email})
+        existing_user = await users_collection.find_one({"email": user.email})
         if existing_user:
-            logger.warning(f"Registration attempt with existing email: {user.email}")
+            logger.warning("Registration attempt with existing email: %s", user.email)
             raise HTTPException(status_code=400, detail="User already exists")
         hashed_password = pwd_context.hash(user.password)
         user_id = str(uuid.uuid4())
@@ -102,32 +116,29 @@ async def register(user: UserRegister):
             "usn": user.usn,
             "course": user.course,
             "semester": user.semester,
-            "is_admin": users_collection.count_documents({}) == 0,
+            "is_admin": (await users_collection.count_documents({})) == 0,
             "created_at": datetime.utcnow(),
         }
-        users_collection.insert_one(user_doc)
-        logger.info(f"New user registered: {user.email}")
+        await users_collection.insert_one(user_doc)
+        logger.info("New user registered: %s", user.email)
         token = create_access_token({"sub": user.email, "is_admin": user_doc["is_admin"]})
         return {"message": "User registered successfully", "token": token, "user_id": user_id}
     except Exception as e:
-        logger.error(f"Registration error: {str(e)}")
+        logger.error("Registration error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/auth/login", tags=["Authentication"])
-async def login(user: UserLogin):
-    if db is None:
-        logger.error("Database not connected during login")
-        raise HTTPException(status_code=500, detail="Database not connected")
+async def login(user: UserLogin, db: AsyncIOMotorDatabase = Depends(get_db)):
     try:
         users_collection = db.users
-        existing_user = users_collection.find_one({"email": user.email})
+        existing_user = await users_collection.find_one({"email": user.email})
         if not existing_user or not pwd_context.verify(user.password, existing_user["password"]):
-            logger.warning(f"Failed login attempt: {user.email}")
+            logger.warning("Failed login attempt: %s", user.email)
             raise HTTPException(status_code=401, detail="Invalid credentials")
         is_admin = existing_user.get("is_admin", False)
         token = create_access_token({"sub": user.email, "is_admin": is_admin})
 
-        logger.info(f"User logged in: {user.email} | Admin: {is_admin}")
+        logger.info("User logged in: %s | Admin: %s", user.email, is_admin)
 
         # IMPORTANT: Return the response object on which you set_cookie
         response = JSONResponse(
@@ -157,25 +168,25 @@ async def login(user: UserLogin):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Login error: {str(e)}")
+        logger.error("Login error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/auth/profile", tags=["Authentication"])
-async def profile(request: Request):
+async def profile(request: Request, db: AsyncIOMotorDatabase = Depends(get_db)):
     try:
         token = request.cookies.get("token")
         if not token:
             raise HTTPException(status_code=401, detail="Token missing or invalid")
         payload = verify_token(token)
         email = payload.get("sub")
-        user = db.users.find_one({"email": email}, {"password": 0})
+        user = await db.users.find_one({"email": email}, {"password": 0})
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         return user
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Profile fetch error: {str(e)}")
+        logger.error("Profile fetch error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 def auto_include_routers(app):
@@ -188,26 +199,32 @@ def auto_include_routers(app):
                     prefix = f"/api/{module_name}".replace("_routes", "")
                     tag = module_name.replace("_", " ").title()
                     app.include_router(module.router, prefix=prefix, tags=[tag])
-                    logger.info(f"Router loaded: {module_name} -> {prefix}")
+                    logger.info("Router loaded: %s -> %s", module_name, prefix)
             except Exception as e:
-                logger.error(f"Error loading router {module_name}: {str(e)}")
+                logger.error("Error loading router %s: %s", module_name, e)
     except Exception as e:
-        logger.error(f"Error auto-loading routers: {str(e)}")
+        logger.error("Error auto-loading routers: %s", e)
 
 auto_include_routers(app)
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    logger.warning(f"HTTP Exception: {exc.status_code} - {exc.detail}")
+    logger.warning("HTTP Exception: %s - %s", exc.status_code, exc.detail)
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
 
 @app.get("/health", tags=["System"])
-async def health_check():
-    db_status = "connected" if db is not None else "disconnected"
-    return {"status": "healthy", "database": db_status}
+async def health_check(db: AsyncIOMotorDatabase = Depends(get_db)):
+    try:
+        # Bounded well below serverSelectionTimeoutMS so probes answer quickly when MongoDB is down
+        await asyncio.wait_for(db.client.admin.command("ping"), timeout=1)
+        db_status = "connected"
+    except Exception:
+        db_status = "disconnected"
+    status = "healthy" if db_status == "connected" else "degraded"
+    return {"status": status, "database": db_status}
 
 @app.get("/", tags=["System"])
 async def root():
@@ -45,6 +45,10 @@ echo "👤 Checking admin user..."
 cd /app/backend
 /root/.venv/bin/python init_db.py
 
+# Restored backups may still carry UUID string ids; the API only accepts ObjectIds
+echo "🔁 Migrating legacy ids..."
+/root/.venv/bin/python migrate_ids_to_objectid.py
+
 # Start continuous backup system (every 3 minutes in background)
 echo "🛡️  Starting CONTINUOUS backup system..."
 /app/scripts/continuous_backup.sh > /var/log/backup.log 2>&1 &
@@ -29,6 +29,10 @@ echo "👤 Ensuring admin user exists..."
 cd /app/backend
 /root/.venv/bin/python init_db.py
 
+# Restored backups may still carry UUID string ids; the API only accepts ObjectIds
+echo "🔁 Migrating legacy ids..."
+/root/.venv/bin/python migrate_ids_to_objectid.py
+
 # Start continuous backup in background
 echo "🛡️  Starting continuous backup system..."
 /app/scripts/continuous_backup.sh > /var/log/backup.log 2>&1 &
@@ -0,0 +1,54 @@
+from bson import ObjectId
+from routes._item_cache import ItemCache, get_item_cache, invalidate_item
+
+
+def test_fetch_result_is_cached():
+    cache = ItemCache()
+    key = ObjectId()
+    generation = cache.begin_fetch(key)
+    cache.end_fetch(key, generation, {"title": "a"})
+    assert cache.get(key) == {"title": "a"}
+
+
+def test_stale_read_not_cached_when_invalidated_mid_fetch():
+    cache = ItemCache()
+    key = ObjectId()
+    generation = cache.begin_fetch(key)
+    cache.invalidate(key)  # a write lands while find_one is awaiting
+    cache.end_fetch(key, generation, {"title": "stale"})
+    assert cache.get(key) is None
+
+
+def test_overlapping_fetches_both_see_the_invalidation():
+    cache = ItemCache()
+    key = ObjectId()
+    first = cache.begin_fetch(key)
+    second = cache.begin_fetch(key)
+    cache.invalidate(key)
+    cache.end_fetch(key, first, {"title": "stale"})
+    cache.end_fetch(key, second, {"title": "stale"})
+    assert cache.get(key) is None
+
+
+def test_fetch_after_invalidation_is_cached():
+    cache = ItemCache()
+    key = ObjectId()
+    cache.invalidate(key)
+    generation = cache.begin_fetch(key)
+    cache.end_fetch(key, generation, {"title": "fresh"})
+    assert cache.get(key) == {"title": "fresh"}
+
+
+def test_missing_document_is_not_cached():
+    cache = ItemCache()
+    key = ObjectId()
+    cache.end_fetch(key, cache.begin_fetch(key), None)
+    assert cache.get(key) is None
+
+
+def test_invalidate_item_reaches_the_shared_cache():
+    cache = get_item_cache("notes")
+    key = ObjectId()
+    cache.end_fetch(key, cache.begin_fetch(key), {"title": "a"})
+    invalidate_item("notes", key)
+    assert cache.get(key) is None
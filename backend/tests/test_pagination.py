@@ -0,0 +1,50 @@
+import base64
+import json
+from datetime import datetime
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from routes._pagination import cursor_filter, decode_cursor, encode_cursor, split_page
+
+
+def make_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def test_cursor_round_trip():
+    doc = {"_id": ObjectId(), "created_at": datetime(2024, 5, 1, 12, 30, 15, 123000)}
+    assert decode_cursor(encode_cursor(doc)) == (doc["created_at"], doc["_id"])
+
+
+def test_no_cursor_without_created_at_or_for_string_ids():
+    assert encode_cursor({"_id": ObjectId()}) is None
+    assert encode_cursor({"_id": "3f2b0c7e-uuid", "created_at": datetime(2024, 1, 1)}) is None
+
+
+@pytest.mark.parametrize("token", [
+    "not base64!",
+    make_cursor({"created_at": "2024-01-01T00:00:00"}),
+    make_cursor({"created_at": "yesterday", "id": str(ObjectId())}),
+    make_cursor({"created_at": "2024-01-01T00:00:00", "id": "3f2b0c7e-uuid"}),
+])
+def test_bad_cursor_is_400(token):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(token)
+    assert exc.value.status_code == 400
+
+
+def test_cursor_filter_seeks_past_position():
+    doc = {"_id": ObjectId(), "created_at": datetime(2024, 1, 1)}
+    assert cursor_filter(encode_cursor(doc)) == {"$or": [
+        {"created_at": {"$lt": doc["created_at"]}},
+        {"created_at": doc["created_at"], "_id": {"$lt": doc["_id"]}},
+    ]}
+
+
+def test_split_page():
+    docs = [{"_id": ObjectId(), "created_at": datetime(2024, 1, day)} for day in range(3, 0, -1)]
+    page, cursor = split_page(docs, 2)
+    assert page == docs[:2]
+    assert decode_cursor(cursor) == (docs[1]["created_at"], docs[1]["_id"])
+    assert split_page(docs, 3) == (docs, None)
+    assert split_page(docs, 2, keyset=False) == (docs[:2], None)
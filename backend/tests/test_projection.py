@@ -0,0 +1,20 @@
+import pytest
+from fastapi import HTTPException
+from routes._projection import build_projection
+
+
+def test_default_excludes_heavy_fields():
+    assert build_projection(None, ("content",)) == {"content": 0}
+
+
+def test_fields_select_explicit_set_plus_timestamps():
+    assert build_projection(" title, tags ,", ("content",)) == {
+        "title": 1, "tags": 1, "created_at": 1, "updated_at": 1,
+    }
+
+
+@pytest.mark.parametrize("fields", [",", "title,$where", "a.b", "1title"])
+def test_invalid_fields_are_400(fields):
+    with pytest.raises(HTTPException) as exc:
+        build_projection(fields, ())
+    assert exc.value.status_code == 400
@@ -0,0 +1,26 @@
+import pytest
+from bson import Regex
+from fastapi import HTTPException
+from routes._search import build_search_filter
+
+FIELDS = ("title", "tags")
+
+
+@pytest.mark.parametrize("q", ["dbms", "what is DBMS?"])
+def test_plain_query_uses_text_index(q):
+    assert build_search_filter(q, FIELDS) == ({"$text": {"$search": q}}, True)
+
+
+def test_trailing_wildcard_is_anchored_escaped_prefix():
+    search_filter, ranked = build_search_filter("a.b*", FIELDS)
+    assert not ranked
+    assert [clause[field] for clause, field in zip(search_filter["$or"], FIELDS)] == [
+        Regex(r"^a\.b", "i"), Regex(r"^a\.b", "i"),
+    ]
+
+
+@pytest.mark.parametrize("q", ["*", "**", "data*base", "*dbms"])
+def test_unsupported_wildcards_are_400(q):
+    with pytest.raises(HTTPException) as exc:
+        build_search_filter(q, FIELDS)
+    assert exc.value.status_code == 400
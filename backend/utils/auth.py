@@ -1,14 +1,15 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
-from config import SECRET_KEY, ALGORITHM
-from database import db
+from jwt import PyJWTError
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from database import get_db
+from routes.auth_utils import decode_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncIOMotorDatabase = Depends(get_db)):
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise HTTPException(status_code=401, detail="Invalid token payload")
@@ -19,7 +20,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
 
         return user
 
-    except JWTError:
+    except PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication token")
 
 async def verify_admin(current_user=Depends(get_current_user)):
@@ -33,6 +33,8 @@ mongorestore --drop --db "$DATABASE_NAME" "$LATEST_BACKUP/$DATABASE_NAME" 2>/dev
 if [ $? -eq 0 ]; then
     echo "✅ Database restored successfully from backup!"
     echo "📊 Restored from: $LATEST_BACKUP"
+    # Backups may predate the ObjectId switch; the API rejects UUID string ids
+    (cd /app/backend && /root/.venv/bin/python migrate_ids_to_objectid.py)
 else
     echo "❌ Failed to restore database"
     exit 1